@@ -0,0 +1,8 @@
+from .paratest import Abort, Configuration, Paratest, Report, Test
+from .persistence import Persistence
+from .events import Events
+
+__all__ = [
+    'Abort', 'Configuration', 'Events', 'Paratest', 'Persistence', 'Report',
+    'Test',
+]
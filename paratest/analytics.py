@@ -0,0 +1,116 @@
+import json
+import math
+from itertools import groupby
+
+
+FORMATS = ('table', 'json')
+
+
+def percentile(values, quantile):
+    index = int(math.ceil(quantile * len(values))) - 1
+    return values[max(index, 0)]
+
+
+class Analytics(object):
+    def __init__(self, persistence, top=10, threshold=0.2):
+        self.persistence = persistence
+        self.top = top
+        self.threshold = threshold
+
+    def collect(self):
+        return dict(
+            (source, self.collect_source(source))
+            for source in self.persistence.get_sources()
+        )
+
+    def collect_source(self, source):
+        tests = self.tests(source)
+        trends = self.trends(source)
+        return {
+            'tests': tests,
+            'slowest': [x['test'] for x in tests[:self.top]],
+            'trends': trends,
+            'regressions': self.regressions(trends),
+        }
+
+    def tests(self, source):
+        tests = []
+        durations = self.persistence.iter_durations(source)
+        for test, rows in groupby(durations, key=lambda x: x[0]):
+            values = [x[1] for x in rows]
+            tests.append({
+                'test': test,
+                'runs': len(values),
+                'p50': percentile(values, 0.5),
+                'p95': percentile(values, 0.95),
+                'max': values[-1],
+            })
+        return sorted(tests, key=lambda x: (-x['p50'], x['test']))
+
+    def trends(self, source):
+        return [
+            {
+                'execution': execution,
+                'timestamp': timestamp,
+                'tests': tests,
+                'runs': runs,
+                'failures': failures,
+                'duration': duration,
+                'longest': longest,
+            }
+            for execution, timestamp, tests, runs, failures, duration, longest
+            in self.persistence.get_summaries(source)
+        ]
+
+    def regressions(self, trends):
+        if len(trends) < 2:
+            return []
+        previous = self.persistence.get_averages(trends[-2]['execution'])
+        current = self.persistence.get_averages(trends[-1]['execution'])
+        regressions = []
+        for test, duration in current.items():
+            before = previous.get(test)
+            if before and duration > before * (1 + self.threshold):
+                regressions.append({
+                    'test': test,
+                    'previous': before,
+                    'current': duration,
+                    'change': duration / before - 1,
+                })
+        return sorted(regressions, key=lambda x: -x['change'])
+
+    def render(self, output_format='table'):
+        data = self.collect()
+        if output_format == 'json':
+            return json.dumps(data, indent=2, sort_keys=True)
+        return '\n'.join(self.render_source(x, data[x]) for x in sorted(data))
+
+    def render_source(self, source, data):
+        msg = 'Project %s\n' % source
+        msg += '  Tests:\n'
+        msg += '    %10s %10s %10s %6s  %s\n' % (
+            'p50', 'p95', 'max', 'runs', 'test',
+        )
+        for test in data['tests']:
+            msg += '    %10.2f %10.2f %10.2f %6d  %s\n' % (
+                test['p50'], test['p95'], test['max'], test['runs'],
+                test['test'],
+            )
+        msg += '  Slowest:\n'
+        for test in data['slowest']:
+            msg += '    %s\n' % test
+        msg += '  Trends:\n'
+        for trend in data['trends']:
+            msg += (
+                '    %s  %10.2fs %6d tests %6d failures %10.2fs longest\n' % (
+                    trend['timestamp'], trend['duration'], trend['tests'],
+                    trend['failures'], trend['longest'],
+                )
+            )
+        msg += '  Regressions (over %d%%):\n' % (self.threshold * 100)
+        for test in data['regressions']:
+            msg += '    %10.2f -> %10.2f (+%d%%)  %s\n' % (
+                test['previous'], test['current'], test['change'] * 100,
+                test['test'],
+            )
+        return msg
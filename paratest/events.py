@@ -0,0 +1,28 @@
+import logging
+import threading
+
+
+logger = logging.getLogger('paratest')
+
+
+class Events(object):
+    TEST_STARTED = 'test_started'
+    TEST_FINISHED = 'test_finished'
+    TEST_RETRIED = 'test_retried'
+
+    def __init__(self):
+        self._callbacks = {}
+        self._lock = threading.Lock()
+
+    def on(self, event, callback):
+        with self._lock:
+            self._callbacks.setdefault(event, []).append(callback)
+
+    def emit(self, event, **kwargs):
+        with self._lock:
+            callbacks = list(self._callbacks.get(event, []))
+        for callback in callbacks:
+            try:
+                callback(**kwargs)
+            except Exception:
+                logger.exception("Callback for %s failed", event)
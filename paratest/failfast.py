@@ -0,0 +1,71 @@
+import fnmatch
+import logging
+import threading
+
+
+logger = logging.getLogger('paratest')
+
+
+class FailFast(object):
+    MIN_SAMPLE = 10
+
+    def __init__(self, max_failures=0, max_failure_rate=0, smoke=None,
+                 on_stop=None):
+        self.max_failures = max_failures
+        self.max_failure_rate = max_failure_rate
+        self.smoke = list(smoke or [])
+        self.on_stop = on_stop
+        self.executed = 0
+        self.failures = 0
+        self.reason = None
+        self.skipped = []
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def stopped(self):
+        return self._stopped.is_set()
+
+    def is_smoke(self, name):
+        return any(fnmatch.fnmatch(name, x) for x in self.smoke)
+
+    def record(self, test, success):
+        with self._lock:
+            self.executed += 1
+            if not success:
+                self.failures += 1
+            reason = self._check(test, success)
+        if reason:
+            self.stop(reason)
+
+    def _check(self, test, success):
+        if not success and self.is_smoke(test.name):
+            return 'Smoke test %s failed' % test.name
+        if self.max_failures and self.failures >= self.max_failures:
+            return 'Reached the maximum of %s failures' % self.max_failures
+        if self._rate_exceeded():
+            return 'Failure rate %.2f exceeded the threshold %.2f' % (
+                float(self.failures) / self.executed,
+                self.max_failure_rate,
+            )
+
+    def _rate_exceeded(self):
+        return (
+            self.max_failure_rate
+            and self.executed >= self.MIN_SAMPLE
+            and float(self.failures) / self.executed > self.max_failure_rate
+        )
+
+    def skip(self, test):
+        with self._lock:
+            self.skipped.append(test)
+
+    def stop(self, reason):
+        with self._lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+            self._stopped.set()
+        logger.error("Stopping the run: %s", reason)
+        if self.on_stop:
+            self.on_stop(reason)
@@ -0,0 +1,168 @@
+import os
+import re
+import uuid
+import logging
+import threading
+from subprocess import Popen, PIPE
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+logger = logging.getLogger('paratest')
+SHELL_SYNTAX = re.compile(r'[|&;<>()$`\\"\'*?\[\]#~={}!\n]')
+SHELL_BUILTINS = frozenset([
+    '.', ':', 'alias', 'bg', 'break', 'case', 'cd', 'command', 'continue',
+    'eval', 'exec', 'exit', 'export', 'fg', 'for', 'getopts', 'hash', 'if',
+    'jobs', 'let', 'local', 'read', 'readonly', 'return', 'set', 'shift',
+    'source', 'times', 'trap', 'type', 'ulimit', 'umask', 'unalias', 'unset',
+    'until', 'wait', 'while',
+])
+
+
+def split(command):
+    if SHELL_SYNTAX.search(command):
+        return None
+    argv = command.split()
+    if not argv or argv[0] in SHELL_BUILTINS:
+        return None
+    return argv
+
+
+def shell(command, wrap=None, cwd=None):
+    command = ['/bin/sh', '-c', command]
+    return wrap(command, cwd=cwd) if wrap else command
+
+
+def command_line(command, wrap=None, cwd=None):
+    argv = split(command)
+    if argv is None:
+        return shell(command, wrap, cwd)
+    return wrap(argv, cwd=cwd) if wrap else argv
+
+
+def substitute(script, placeholders):
+    for k, v in placeholders.items():
+        script = script.replace('{%s}' % k, v)
+    return script
+
+
+class Hook(object):
+    def __init__(self, script, wrap=None, **placeholders):
+        self.script = substitute(script, placeholders) if script else None
+        self.command = (
+            command_line(self.script, wrap) if self.script else None
+        )
+
+    def __bool__(self):
+        return self.script is not None
+
+    __nonzero__ = __bool__
+
+    def run(self, session=None):
+        if not self:
+            return
+        logger.info("About to run script $%s", self.script)
+        if session is not None:
+            returncode, output, err = session.run(self.script)
+        else:
+            returncode, output, err = self._spawn()
+        if output != '':
+            logger.info(output)
+        if err != '':
+            logger.warning(err)
+        return returncode
+
+    def _spawn(self):
+        try:
+            result = Popen(self.command, stdout=PIPE, stderr=PIPE)
+        except OSError as e:
+            return 127, '', str(e)
+        output, err = result.communicate()
+        return result.returncode, output.decode("utf-8"), err.decode("utf-8")
+
+
+class Session(object):
+    def __init__(self, wrap=None):
+        self.wrap = wrap
+        self.cwd = os.getcwd()
+        self.marker = '__paratest_%s__' % uuid.uuid4().hex
+        self._shell = None
+        self._errors = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        command = ['/bin/sh']
+        self._shell = Popen(
+            self.wrap(command, cwd=self.cwd) if self.wrap else command,
+            stdin=PIPE, stdout=PIPE, stderr=PIPE,
+        )
+        self._errors = queue.Queue()
+        thread = threading.Thread(
+            target=self._drain, args=(self._shell.stderr, self._errors)
+        )
+        thread.daemon = True
+        thread.start()
+
+    @staticmethod
+    def _drain(stream, lines):
+        for line in iter(stream.readline, b''):
+            lines.put(line.decode("utf-8"))
+        lines.put(None)
+
+    def _write(self, script):
+        # each script runs in the same shell, from the same directory; a
+        # marker line ends its output on both streams, the one on stdout
+        # carries the exit code. The leading ':' accepts empty and
+        # comment-only scripts.
+        self._shell.stdin.write((
+            "cd '%s'\n{ :\n%s\n} </dev/null\n"
+            "printf '\\n%s %%d\\n' $?\nprintf '\\n%s\\n' >&2\n"
+            % (self.cwd.replace("'", "'\\''"), script, self.marker,
+               self.marker)
+        ).encode("utf-8"))
+        self._shell.stdin.flush()
+
+    def _read_output(self):
+        lines = []
+        for line in iter(self._shell.stdout.readline, b''):
+            line = line.decode("utf-8")
+            if line.startswith(self.marker):
+                return int(line.split()[1]), ''.join(lines)[:-1]
+            lines.append(line)
+        return None, ''.join(lines)
+
+    def _read_errors(self, errors):
+        lines = []
+        for line in iter(errors.get, None):
+            if line.startswith(self.marker):
+                return ''.join(lines)[:-1]
+            lines.append(line)
+        return ''.join(lines)
+
+    def run(self, script):
+        with self._lock:
+            if self._shell is None:
+                self._start()
+            errors = self._errors
+            try:
+                self._write(script)
+            except (IOError, OSError) as e:
+                self.close()
+                return 127, '', str(e)
+            returncode, output = self._read_output()
+            if returncode is None:
+                returncode = self.close()
+            err = self._read_errors(errors)
+        return 127 if returncode is None else returncode, output, err
+
+    def close(self):
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+        try:
+            shell.stdin.close()
+        except (IOError, OSError):
+            pass
+        return shell.wait()
@@ -0,0 +1,111 @@
+import os
+import logging
+from subprocess import Popen, PIPE
+
+
+logger = logging.getLogger('paratest')
+MODES = ('none', 'namespace')
+PRIVATE_TMP = '/tmp'
+
+
+class IsolationException(Exception):
+    pass
+
+
+def quote(path):
+    return "'%s'" % path.replace("'", "'\\''")
+
+
+class Namespace(object):
+    def __init__(self, name, paths=()):
+        self.name = name
+        self.paths = [os.path.realpath(x) for x in paths if x]
+        self.user = os.geteuid() != 0
+        self._holder = None
+        self._init = None
+
+    def _hidden_paths(self):
+        return [
+            x for x in self.paths
+            if x.startswith(PRIVATE_TMP + os.sep) and os.path.isdir(x)
+        ]
+
+    def script(self):
+        # paths below /tmp are kept open to bind them again over the
+        # private tmpfs; the holder process keeps the namespaces alive
+        # until its stdin is closed
+        hidden = self._hidden_paths()
+        lines = ['set -e']
+        lines += [
+            'exec %d<%s' % (fd, quote(path))
+            for fd, path in enumerate(hidden, 3)
+        ]
+        lines.append('mount -t tmpfs tmpfs %s' % PRIVATE_TMP)
+        for fd, path in enumerate(hidden, 3):
+            lines.append('mkdir -p %s' % quote(path))
+            lines.append(
+                'mount --no-canonicalize --bind /proc/self/fd/%d %s'
+                % (fd, quote(path))
+            )
+        lines.append(
+            'ip link set lo up || '
+            '{ echo "could not bring up the loopback interface" >&2; exit 1; }'
+        )
+        lines.append('echo ready')
+        lines.append('exec cat')
+        return '\n'.join(lines)
+
+    def start(self):
+        # the holder is pid 1 of its own pid namespace: everything started
+        # inside dies with it
+        command = [
+            'unshare', '--net', '--mount', '--pid', '--fork', '--mount-proc',
+        ]
+        if self.user:
+            command += ['--user', '--map-root-user']
+        logger.debug("Creating namespace for worker %s", self.name)
+        try:
+            self._holder = Popen(
+                command + ['/bin/sh', '-c', self.script()],
+                stdin=PIPE, stdout=PIPE, stderr=PIPE,
+            )
+        except OSError as e:
+            raise IsolationException(
+                'Could not create namespace for worker %s: %s' % (self.name, e)
+            )
+        if self._holder.stdout.readline().strip() != b'ready':
+            self._failed()
+        self._init = self._child(self._holder.pid)
+        return self
+
+    def _child(self, pid):
+        with open('/proc/%d/task/%d/children' % (pid, pid)) as fd:
+            return int(fd.read().split()[0])
+
+    def _failed(self):
+        stdout, stderr = self._holder.communicate()
+        self._holder = None
+        self._init = None
+        raise IsolationException(
+            'Could not create namespace for worker %s: %s'
+            % (self.name, stderr.decode('utf-8').strip())
+        )
+
+    def wrap(self, command, cwd=None):
+        if self._holder is None:
+            return command
+        # entering the mount namespace resets the working directory
+        prefix = [
+            'nsenter', '--target', str(self._init),
+            '--mount', '--net', '--pid', '--wd=%s' % (cwd or os.getcwd()),
+        ]
+        if self.user:
+            prefix.append('--user')
+        return prefix + command
+
+    def stop(self):
+        if self._holder is None:
+            return
+        self._holder.communicate()
+        self._holder = None
+        self._init = None
@@ -7,6 +7,7 @@ import threading
 import logging
 import time
 import copy
+import signal
 from subprocess import Popen, PIPE
 try:
     import queue
@@ -14,20 +15,36 @@ except ImportError:
     import Queue as queue
 from .plugins import Plugins
 from .persistence import Persistence
+from .tracing import Tracer, NullTracer
+from .workspace import Cloner, CloneException, remove
+from .failfast import FailFast
+from .scheduling import ORDERS
+from .events import Events
+from .analytics import FORMATS
+from .isolation import MODES, Namespace, IsolationException
+from .hooks import Hook, Session, command_line
 
 
 logger = logging.getLogger('paratest')
-shared_queue = queue.PriorityQueue()
-shared_queue_retries = queue.PriorityQueue()
 THIS_DIR = os.path.dirname(os.path.realpath(__file__))
+NEW_SESSION = (
+    {'start_new_session': True}
+    if sys.version_info >= (3, 2)
+    else {'preexec_fn': getattr(os, 'setsid', None)}
+)
 
 
 class Abort(Exception):
     pass
 
 
+class Interrupted(Exception):
+    pass
+
+
 class Scripts(object):
     setup = None
+    setup_golden = None
     setup_workspace = None
     setup_test = None
     teardown_test = None
@@ -36,7 +53,6 @@ class Scripts(object):
 
 
 class Configuration(object):
-    scripts = Scripts()
     verbosity = 0
     workers = 1
 
@@ -45,9 +61,24 @@ class Configuration(object):
     project_name = None
     output_path = None
     test_pattern = None
+    trace = False
+    clone_method = None
+    max_retries = 0
+    max_failures = 0
+    max_failure_rate = 0
+    smoke = None
+    order = 'duration'
+    show_format = 'table'
+    top = 10
+    regression_threshold = 0.2
+    isolation = 'none'
+    resume = False
 
     workspace_path = None
 
+    def __init__(self):
+        self.scripts = Scripts()
+
     def load_from(self, config_file):
         with open(config_file) as fd:
             for line in fd.readlines():
@@ -58,6 +89,10 @@ class Configuration(object):
                     setattr(self, key, value)
 
 
+def interrupt(signum, frame):
+    raise Interrupted('Received signal %s' % signum)
+
+
 def configure_logging(verbosity):
     msg_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     VERBOSITIES = [logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG]
@@ -137,6 +172,12 @@ def main():
         help='Script to prepare everything;'
         ' it will be run once at the beginning'
     )
+    parser.add_argument(
+        '--setup-golden',
+        dest='setup_golden',
+        help='Script to prepare the golden workspace when cloning workspaces;'
+        ' it will be run once, before cloning'
+    )
     parser.add_argument(
         '--setup-workspace',
         dest='setup_workspace',
@@ -169,6 +210,89 @@ def main():
         type=int,
         help='Times to retry a failing test'
     )
+    parser.add_argument(
+        '--format',
+        dest='show_format',
+        choices=FORMATS,
+        default='table',
+        help='Output format for the show action'
+    )
+    parser.add_argument(
+        '--top',
+        default=10,
+        type=int,
+        help='Number of slowest tests reported by the show action'
+    )
+    parser.add_argument(
+        '--regression-threshold',
+        dest='regression_threshold',
+        default=0.2,
+        type=float,
+        help='Minimum slowdown (0.2 is 20%%) since the previous execution'
+        ' reported as a regression by the show action'
+    )
+    parser.add_argument(
+        '--order',
+        choices=sorted(ORDERS),
+        default='duration',
+        help='Strategy to sort the tests: longest first (duration) or'
+        ' recently failing and new tests first (failures-first)'
+    )
+    parser.add_argument(
+        '--max-failures',
+        dest='max_failures',
+        default=0,
+        type=int,
+        help='Stop the run after this number of failed tests'
+    )
+    parser.add_argument(
+        '--max-failure-rate',
+        dest='max_failure_rate',
+        default=0,
+        type=float,
+        help='Stop the run when the ratio of failed tests (0-1) goes over'
+        ' this threshold'
+    )
+    parser.add_argument(
+        '--smoke',
+        action='append',
+        default=[],
+        help='Pattern of smoke tests; they run first and the run stops if'
+        ' any of them fails. May be repeated'
+    )
+    parser.add_argument(
+        '--clone-workspaces',
+        dest='clone_method',
+        choices=sorted(Cloner.METHODS),
+        default=None,
+        help='Prepare a golden workspace from the source and clone it for'
+        ' every worker in parallel, before running setup-workspace. auto'
+        ' uses copy-on-write reflinks and falls back to copies; hardlink'
+        ' shares the files, so a test that modifies one in place changes it'
+        ' for every worker'
+    )
+    parser.add_argument(
+        '--isolation',
+        choices=MODES,
+        default='none',
+        help='Run each worker (setup-workspace, tests and the rest of its'
+        ' scripts) in its own network and mount namespace with a private'
+        ' /tmp'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        default=False,
+        help='Continue the last execution if it was interrupted, skipping'
+        ' the tests that already passed'
+    )
+    parser.add_argument(
+        '--trace',
+        action='store_true',
+        default=False,
+        help='Record span timings and export them as a Chrome trace'
+        ' (trace.json) in the output path'
+    )
 
     args = parser.parse_args()
     configure_logging(args.verbosity)
@@ -180,6 +304,7 @@ def main():
 
     config = Configuration()
     config.scripts.setup = args.setup
+    config.scripts.setup_golden = args.setup_golden
     config.scripts.setup_workspace = args.setup_workspace
     config.scripts.setup_test = args.setup_test
     config.scripts.teardown_test = args.teardown_test
@@ -192,12 +317,24 @@ def main():
     config.output_path = args.output_path
     config.test_pattern = args.test_pattern
     config.max_retries = args.retry
+    config.max_failures = args.max_failures
+    config.max_failure_rate = args.max_failure_rate
+    config.smoke = args.smoke
+    config.order = args.order
+    config.show_format = args.show_format
+    config.top = args.top
+    config.regression_threshold = args.regression_threshold
+    config.trace = args.trace
+    config.clone_method = args.clone_method
+    config.isolation = args.isolation
+    config.resume = args.resume
 
     config.workspace_path = (
         tempfile.mkdtemp()
         if args.workspace_path is None
-        else None
+        else args.workspace_path
     )
+    signal.signal(signal.SIGTERM, interrupt)
     try:
         process(config, args.action, args.plugin)
     except Abort as e:
@@ -221,16 +358,21 @@ def process(config, action, plugin):
     if action == 'plugins':
         return paratest.list_plugins(config.verbosity > 0)
     elif action == 'run':
-        persistence.initialize()
+        persistence.initialize(resume=config.resume)
         return paratest.run(plugin)
     elif action == 'show':
-        return persistence.show()
+        return persistence.show(
+            config.show_format,
+            config.top,
+            config.regression_threshold,
+        )
 
 
 class Test(object):
     FINISH = None
     INFINITE = sys.maxsize
     RETRY_PENALTY = 100000
+    SMOKE_BONUS = 10 ** 9
 
     def __init__(self, name, command=FINISH, priority=INFINITE):
         self.name = name
@@ -262,35 +404,28 @@ class Test(object):
         return self.name
 
 
-def run_script(script, **kwargs):
-    if not script:
-        return
-    for k, v in kwargs.items():
-        script = script.replace('{%s}' % k, v)
-
-    logger.info("About to run script $%s", script)
-
-    result = Popen(script, shell=True, stdout=PIPE, stderr=PIPE)
-    output, err = result.communicate()
-
-    output = output.decode("utf-8")
-    err = err.decode("utf-8")
-
-    if output != '':
-        logger.info(output)
-    if err != '':
-        logger.warning(err)
-    return result.returncode
+def run_script(script, wrap=None, **kwargs):
+    return Hook(script, wrap, **kwargs).run()
 
 
 class Paratest(object):
-    def __init__(self, config, persistence):
+    def __init__(self, config, persistence, events=None):
         self._workers = []
+        self.resumed = []
         self.config = config
         self.persistence = persistence
+        self.events = events or Events()
+        self.queue = queue.PriorityQueue()
+        self.tracer = Tracer() if config.trace else NullTracer()
+        self.fail_fast = FailFast(
+            max_failures=config.max_failures,
+            max_failure_rate=config.max_failure_rate,
+            smoke=config.smoke,
+            on_stop=self.stop,
+        )
 
         if not os.path.exists(config.source):
-            os.makedirs(self.source)
+            os.makedirs(config.source)
         if not os.path.exists(config.output_path):
             os.makedirs(config.output_path)
 
@@ -309,48 +444,143 @@ class Paratest(object):
             )
         print(msg)
 
-    def run(self, plugin_name):
+    def on(self, event, callback):
+        self.events.on(event, callback)
+
+    @property
+    def reports(self):
+        return self.resumed + [
+            report for t in self._workers for report in t.report
+        ]
+
+    def run(self, plugin):
         try:
-            plugin = Plugins().load(plugin_name)
-            self.run_script_setup()
-            test_number = self.queue_tests(plugin)
-            self.create_workers(self.num_of_workers(test_number))
-            self.start_workers()
-            self.wait_workers()
-            self.run_script_teardown()
-            self.assert_all_messages_were_processed()
-            self.assert_all_workers_were_successful()
+            with self.tracer.span('run'):
+                self._run(plugin)
             logger.info("Finished successfully")
+        except (KeyboardInterrupt, Interrupted) as e:
+            # tests run in their own session and miss the terminal signals
+            self.fail_fast.stop(str(e) or 'Interrupted by the user')
+            self.wait_workers()
+            raise Abort(self.fail_fast.reason)
         finally:
             self.print_report()
+            self.export_trace()
+
+    def _run(self, plugin):
+        if not callable(plugin):
+            plugin = Plugins().load(plugin)
+        self.run_script_setup()
+        test_number = self.queue_tests(plugin)
+        self.create_workers(self.num_of_workers(test_number))
+        self.provision_workspaces()
+        with self.tracer.span('workers'):
+            self.start_workers()
+            self.wait_workers()
+        self.finish_execution()
+        self.run_script_teardown()
+        self.assert_not_stopped()
+        self.assert_all_messages_were_processed()
+        self.assert_all_workers_were_successful()
+
+    def finish_execution(self):
+        if not self.fail_fast.stopped:
+            self.persistence.finish()
+
+    def export_trace(self):
+        filename = self.tracer.export(self.config.output_path)
+        if filename:
+            logger.info("Trace written to %s", filename)
 
     def run_script_setup(self):
-        if run_script(self.config.scripts.setup,
-                      path=self.config.workspace_path):
+        with self.tracer.span('setup', 'hook'):
+            returncode = run_script(self.config.scripts.setup,
+                                    path=self.config.workspace_path)
+        if returncode:
             raise Abort('The setup script failed. aborting.')
 
     def run_script_teardown(self):
-        if run_script(self.config.scripts.teardown,
-                      path=self.config.workspace_path):
+        with self.tracer.span('teardown', 'hook'):
+            returncode = run_script(self.config.scripts.teardown,
+                                    path=self.config.workspace_path)
+        if returncode:
             raise Abort('The teardown script failed, but nothing can be done.')
 
+    def provision_workspaces(self):
+        if not self.config.clone_method:
+            return
+        golden = os.path.join(self.config.workspace_path, 'golden')
+        cloner = Cloner(self.config.clone_method)
+        try:
+            with self.tracer.span('golden', 'workspace'):
+                # never hardlink the golden workspace: it would share inodes
+                # with the source and setup-golden could modify it
+                Cloner(
+                    'auto' if cloner.method == 'hardlink' else cloner.method
+                ).clone(self.config.source, golden)
+                self.run_script_setup_golden(golden)
+            with self.tracer.span('clone', 'workspace'):
+                cloner.clone_many(
+                    golden, [t.workspace_path for t in self._workers]
+                )
+        except CloneException as e:
+            raise Abort(str(e))
+        finally:
+            remove(golden)
+
+    def run_script_setup_golden(self, golden):
+        if run_script(self.config.scripts.setup_golden,
+                      golden=golden,
+                      source=self.config.source,
+                      output=self.config.output_path):
+            raise Abort('The setup golden script failed. aborting.')
+
     def queue_tests(self, find):
-        tids = 0
-        pluginobjs = find(
+        with self.tracer.span('queue_tests', 'discovery'):
+            return self._queue_tests(find)
+
+    def _queue_tests(self, find):
+        pluginobjs = self.skip_passed(list(find(
             self.config.source,
             test_pattern=None,
             file_pattern=self.config.test_pattern,
             output_path=self.config.output_path,
+        )))
+        self.persistence.add_pending([name for name, _ in pluginobjs])
+        priorities = self.scheduler().priorities(
+            [name for name, _ in pluginobjs]
         )
         for test_name, test_cmd in pluginobjs:
-            test = Test(
-                test_name,
-                test_cmd,
-                self.persistence.get_priority(test_name),
-            )
-            shared_queue.put(test)
-            tids += 1
-        return tids
+            priority = priorities[test_name]
+            if self.fail_fast.is_smoke(test_name):
+                priority -= Test.SMOKE_BONUS
+            test = Test(test_name, test_cmd, priority)
+            self.queue.put(test)
+        return len(pluginobjs)
+
+    def skip_passed(self, pluginobjs):
+        if not self.persistence.resumed:
+            return pluginobjs
+        checkpoint = self.persistence.get_checkpoint()
+        pending = []
+        for test_name, test_cmd in pluginobjs:
+            status, duration = checkpoint.get(test_name, (None, None))
+            if status == 'passed':
+                test = Test(test_name, test_cmd)
+                self.resumed.append(Report(test, duration, True))
+            else:
+                pending.append((test_name, test_cmd))
+        logger.info(
+            "Resuming: %s tests already passed, %s left",
+            len(self.resumed), len(pending),
+        )
+        return pending
+
+    def scheduler(self):
+        return ORDERS[self.config.order](
+            self.persistence.get_history(),
+            self.persistence.get_executions(),
+        )
 
     def create_workers(self, workers):
         for i in range(workers):
@@ -358,7 +588,10 @@ class Paratest(object):
                 config=self.config,
                 persistence=self.persistence,
                 name=str(i),
-                queue=shared_queue,
+                queue=self.queue,
+                tracer=self.tracer,
+                fail_fast=self.fail_fast,
+                events=self.events,
             )
             self._workers.append(t)
 
@@ -369,10 +602,27 @@ class Paratest(object):
         logger.debug("start workers")
         for t in self._workers:
             t.start()
-            shared_queue.put(Test('finish'))
+            self.queue.put(Test('finish'))
+
+    def stop(self, reason):
+        self.drain_queue()
+        for t in self._workers:
+            self.queue.put(Test('finish'))
+        for t in self._workers:
+            t.terminate()
+
+    def drain_queue(self):
+        while True:
+            try:
+                test = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if not test.must_finish:
+                self.fail_fast.skip(test)
 
     def print_report(self):
         msg = 'Global Report:\n'
+        msg += self.resumed_report()
         durations = {}
         for t in self._workers:
             msg += 'Worker %s\n' % t.name
@@ -387,19 +637,40 @@ class Paratest(object):
         bucklet = max(durations.values()) if durations else 0
         total = bucklet * len(durations)
         msg += "\nIdle time: %.4fs\n" % (total - sum(durations.values()))
-        print(msg)
+        print(msg + self.stop_report())
+
+    def resumed_report(self):
+        if not self.resumed:
+            return ''
+        msg = 'Passed before resuming\n'
+        for result in self.resumed:
+            msg += '   %.4fs %s ... OK\n' % (result.duration, result.test)
+        return msg
+
+    def stop_report(self):
+        if not self.fail_fast.stopped:
+            return ''
+        msg = 'Stopped: %s\n' % self.fail_fast.reason
+        msg += 'Skipped %s tests:\n' % len(self.fail_fast.skipped)
+        for test in sorted(self.fail_fast.skipped, key=lambda x: x.name):
+            msg += '   %s\n' % test
+        return msg
 
     def wait_workers(self):
         logger.debug("wait for all workers to finish")
         for t in self._workers:
             t.join()
 
+    def assert_not_stopped(self):
+        if self.fail_fast.stopped:
+            raise Abort(self.fail_fast.reason)
+
     def assert_all_workers_were_successful(self):
         if any(x.errors for x in self._workers):
             raise Abort('One or more workers failed')
 
     def assert_all_messages_were_processed(self):
-        if not shared_queue.empty():
+        if not self.queue.empty():
             raise Abort(
                 'There were unprocessed tests, '
                 'but all workers are dead. Aborting.'
@@ -414,18 +685,35 @@ class Report(object):
 
 
 class Worker(threading.Thread):
+    HOOKS = (
+        'setup_workspace', 'setup_test', 'teardown_test', 'teardown_workspace',
+    )
+    PER_TEST_HOOKS = ('setup_test', 'teardown_test')
+    GRACE = 2
+
     def __init__(
             self,
             name,
             config,
             queue,
             persistence,
+            tracer=None,
+            fail_fast=None,
+            events=None,
             *args,
             **kwargs
     ):
         super(Worker, self).__init__(*args, **kwargs)
         self.config = config
         self.persistence = persistence
+        self.tracer = tracer or NullTracer()
+        self.fail_fast = fail_fast or FailFast()
+        self.events = events or Events()
+        self.namespace = None
+        self.hooks = {}
+        self.session = None
+        self._process = None
+        self._terminated = False
         self.workspace_path = os.path.join(config.workspace_path, self.name)
         if not os.path.exists(self.workspace_path):
             os.makedirs(self.workspace_path)
@@ -436,67 +724,153 @@ class Worker(threading.Thread):
     def run(self):
         print("%s START" % self.name)
         logger.debug("%s START" % self.name)
-        self.run_script_setup_workspace()
-        self.errors = False
+        try:
+            self.isolate()
+            self.compile_hooks()
+            self.run_script_setup_workspace()
+            self.errors = False
+            self.consume()
+            self.run_script_teardown_workspace()
+        except Abort as e:
+            self.errors = True
+            logger.critical(e)
+            self.fail_fast.stop(str(e))
+        finally:
+            self.release()
+        logger.info("Worker %s has finished.", self.name)
+
+    @property
+    def wrap(self):
+        return self.namespace.wrap if self.namespace else None
+
+    def isolate(self):
+        if self.config.isolation != 'namespace':
+            return
+        namespace = Namespace(
+            self.name,
+            [self.workspace_path, self.config.source, self.config.output_path],
+        )
+        try:
+            self.namespace = namespace.start()
+        except IsolationException as e:
+            raise Abort(str(e))
+
+    def compile_hooks(self):
+        for name in self.HOOKS:
+            self.hooks[name] = Hook(
+                getattr(self.config.scripts, name),
+                wrap=self.wrap,
+                id=self.name,
+                workspace=self.workspace_path,
+                source=self.config.source,
+                output=self.config.output_path,
+            )
+        if any(self.hooks[x] for x in self.PER_TEST_HOOKS):
+            self.session = Session(wrap=self.wrap)
+
+    def release(self):
+        if self.session:
+            self.session.close()
+            self.session = None
+        if self.namespace:
+            self.namespace.stop()
+            self.namespace = None
+
+    def consume(self):
         while True:
             self.run_script_setup_test()
 
-            test = self.queue.get()
+            with self.tracer.span('queue_wait', 'queue'):
+                test = self.queue.get()
             if test.must_finish:
                 break
-            try:
-                self.process(test)
-            except Exception:
-                self.failure(test)
+            self.handle(test)
 
             self.queue.task_done()
 
             self.run_script_teardown_test()
-        self.run_script_teardown_workspace()
-        logger.info("Worker %s has finished.", self.name)
+
+    def handle(self, test):
+        if self.fail_fast.stopped:
+            self.fail_fast.skip(test)
+            return
+        try:
+            self.process(test)
+        except Interrupted:
+            self.fail_fast.skip(test)
+        except Exception:
+            self.failure(test)
+        else:
+            self.fail_fast.record(test, True)
 
     def failure(self, test):
-        if test.retries < self.config.max_retries:
+        retry = not self.fail_fast.stopped
+        if retry and test.retries < self.config.max_retries:
             test.increase_retries()
+            self.events.emit(Events.TEST_RETRIED, worker=self, test=test)
             self.queue.put(test)
         else:
             self.errors = True
+            self.fail_fast.record(test, False)
+
+    def terminate(self):
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        logger.warning("Terminating running test on worker %s", self.name)
+        self._terminated = True
+        self._signal(process, signal.SIGTERM)
+        timer = threading.Timer(self.GRACE, self._kill, args=(process,))
+        timer.daemon = True
+        timer.start()
+
+    def _kill(self, process):
+        if self._process is process:
+            logger.warning("Killing running test on worker %s", self.name)
+            self._signal(process, signal.SIGKILL)
+
+    @staticmethod
+    def _signal(process, signum):
+        try:
+            os.killpg(process.pid, signum)
+        except (AttributeError, OSError):
+            process.send_signal(signum)
 
     def run_script_setup_workspace(self):
-        self._run_script(
-            self.config.scripts.setup_workspace,
+        self._run_hook(
+            'setup_workspace',
             'Setup workspace failed on worker %s '
             'and could not initialize the environment. Worker is dead'
             % self.name
         )
 
     def run_script_teardown_workspace(self):
-        self._run_script(
-            self.config.scripts.teardown_workspace,
+        self._run_hook(
+            'teardown_workspace',
             'Teardown workspace failed on worker %s. Worker is dead'
             % self.name
         )
 
     def run_script_setup_test(self):
-        self._run_script(
-            self.config.scripts.setup_test,
+        self._run_hook(
+            'setup_test',
             "setup_test failed on worker %s. Worker is dead" % self.name
         )
 
     def run_script_teardown_test(self):
-        self._run_script(
-            self.config.scripts.teardown_test,
+        self._run_hook(
+            'teardown_test',
             "teardown_test failed on worker %s. Worker is dead" % self.name
         )
 
-    def _run_script(self, script, message):
-        if run_script(
-                script,
-                id=self.name,
-                workspace=self.workspace_path,
-                source=self.config.source,
-                output=self.config.output_path,
-        ):
+    def _run_hook(self, name, message):
+        hook = self.hooks.get(name)
+        if not hook:
+            return
+        session = self.session if name in self.PER_TEST_HOOKS else None
+        with self.tracer.span(name, 'hook'):
+            returncode = hook.run(session)
+        if returncode:
             raise Abort(message)
 
     def process(self, test):
@@ -507,44 +881,65 @@ class Worker(threading.Thread):
                 runner=self.name,
                 test=test.name,
                 workspace=self.workspace_path,
-                left=shared_queue.qsize(),
+                left=self.queue.qsize(),
             )
         )
+        self.events.emit(Events.TEST_STARTED, worker=self, test=test)
+        start = time.time()
         try:
-            start = time.time()
-            self.execute(test)
-            duration = time.time() - start
-            self.persistence.add(test.name, duration)
-            report = Report(test=test, duration=duration, success=True)
+            with self.tracer.span(str(test), 'test'):
+                self.execute(test)
+        except Interrupted:
+            logger.warning("Suite %s was interrupted", test)
+            raise
         except Exception as e:
             duration = time.time() - start
+            self.persistence.add(test.name, duration, success=False)
             logger.error("Suite %s failed due to: %s", test, e)
-            report = Report(test=test, duration=duration, success=False)
+            self.finish(Report(test=test, duration=duration, success=False))
             raise
-        finally:
-            self.report.append(report)
+        duration = time.time() - start
+        self.persistence.add(test.name, duration)
+        self.finish(Report(test=test, duration=duration, success=True))
+
+    def finish(self, report):
+        self.report.append(report)
+        self.events.emit(Events.TEST_FINISHED, worker=self, report=report)
 
     def execute(self, test):
         command = test.solved_command(self.name, self.workspace_path)
         logger.debug("Running command: %s", command)
+        self._terminated = False
         result = Popen(
-            command,
-            shell=True,
+            command_line(command, self.wrap, cwd=self.workspace_path),
             stdout=PIPE,
             stderr=PIPE,
             cwd=self.workspace_path,
+            **NEW_SESSION
         )
+        self._process = result
+        if self.fail_fast.stopped:
+            self.terminate()
         stdout, stderr = result.communicate()
+        self._process = None
         if stdout:
             logger.debug(stdout.decode("utf-8"))
         if stderr:
             logger.warning(stderr.decode("utf-8"))
-        if result.returncode != 0:
-            raise Exception(
-                "Test %s failed with code %s",
-                test.name,
-                result.returncode,
+        self.check(test, result.returncode)
+
+    def check(self, test, returncode):
+        if returncode == 0:
+            return
+        if self._terminated:
+            raise Interrupted(
+                "Test %s was terminated with code %s" % (test.name, returncode)
             )
+        raise Exception(
+            "Test %s failed with code %s",
+            test.name,
+            returncode,
+        )
 
 
 if __name__ == '__main__':
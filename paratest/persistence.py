@@ -1,19 +1,29 @@
 import os
 import sqlite3
 import logging
+from .analytics import Analytics
 
 
 logger = logging.getLogger('paratest')
 
 
+class History(object):
+    def __init__(self, test, duration, first_execution, last_failure):
+        self.test = test
+        self.duration = duration
+        self.first_execution = first_execution
+        self.last_failure = last_failure
+
+
 class Persistence(object):
     def __init__(self, db_path, projectname):
         self.create = not os.path.exists(db_path)
         self.projectname = projectname
         self.db_path = db_path
         self.execution = None
+        self.resumed = False
 
-    def initialize(self):
+    def initialize(self, resume=False):
         con = sqlite3.connect(self.db_path)
         if self.create:
             with con:
@@ -21,16 +31,26 @@ class Persistence(object):
                 con.execute(
                     "create table executions"
                     "(id integer primary key, source varchar, "
-                    "timestamp date default (datetime('now','localtime')))"
+                    "timestamp date default (datetime('now','localtime')), "
+                    "finished int default 0)"
                 )
                 con.execute(
                     "create table testtime"
                     "(id integer primary key, source varchar, test varchar, "
-                    "duration float, execution int, "
+                    "duration float, execution int, success int default 1, "
                     "FOREIGN KEY(execution) "
                     "REFERENCES executions(id) on delete cascade)"
                 )
             self.create = False
+        self._migrate(con)
+        self._prune(con)
+        self.execution = self._unfinished(con) if resume else None
+        self.resumed = self.execution is not None
+        if not self.resumed:
+            self.execution = self._start(con)
+        con.close()
+
+    def _prune(self, con):
         with con:
             c = con.execute(
                 "select id from executions where source=? "
@@ -50,46 +70,245 @@ class Persistence(object):
                     "where execution <= ? and source=?",
                     (deprecated_executions, self.projectname)
                 )
-            con.execute("insert into executions(source) values (?)",
-                        (self.projectname, ))
+                con.execute(
+                    "delete from testsummary "
+                    "where execution <= ? and source=?",
+                    (deprecated_executions, self.projectname)
+                )
+                con.execute(
+                    "delete from checkpoint "
+                    "where execution <= ? and source=?",
+                    (deprecated_executions, self.projectname)
+                )
+
+    def _start(self, con):
+        with con:
+            con.execute(
+                "insert into executions(source, finished) values (?, 0)",
+                (self.projectname, )
+            )
             c = con.execute("select max(id) from executions where source=?",
                             (self.projectname, ))
-            self.execution = c.fetchone()[0]
-        con.close()
+            return c.fetchone()[0]
+
+    def _unfinished(self, con):
+        c = con.execute(
+            "select id, finished from executions where source=? "
+            "order by id desc limit 1",
+            (self.projectname, )
+        )
+        f = c.fetchone()
+        if f is None or f[1]:
+            logger.warning("There is no interrupted execution to resume")
+            return None
+        logger.info("Resuming execution %s", f[0])
+        return f[0]
+
+    def _migrate(self, con):
+        columns = [x[1] for x in con.execute('pragma table_info(testtime)')]
+        if 'success' not in columns:
+            with con:
+                logger.info("Adding test results to persistence file")
+                con.execute(
+                    'alter table testtime add column success int default 1'
+                )
+        columns = [x[1] for x in con.execute('pragma table_info(executions)')]
+        if 'finished' not in columns:
+            with con:
+                con.execute(
+                    'alter table executions add column finished int default 1'
+                )
+        tables = [x[0] for x in con.execute(
+            "select name from sqlite_master where type='table'"
+        )]
+        if 'testsummary' not in tables:
+            self._create_summaries(con)
+        if 'checkpoint' not in tables:
+            self._create_checkpoint(con)
+        with con:
+            con.execute(
+                'create index if not exists testtime_test '
+                'on testtime(source, success, test, duration)'
+            )
+            con.execute(
+                'create index if not exists testtime_execution '
+                'on testtime(execution)'
+            )
+
+    def _create_checkpoint(self, con):
+        with con:
+            con.execute(
+                'create table checkpoint'
+                '(execution int, source varchar, test varchar, '
+                'status varchar, duration float, '
+                'primary key(execution, test))'
+            )
+
+    def _create_summaries(self, con):
+        with con:
+            logger.info("Adding test summaries to persistence file")
+            con.execute(
+                'create table testsummary'
+                '(execution int, source varchar, test varchar, '
+                'runs int, failures int, total float, maximum float, '
+                'primary key(execution, test))'
+            )
+            con.execute(
+                'create index testsummary_source '
+                'on testsummary(source, execution)'
+            )
+            con.execute(
+                'insert into testsummary'
+                '(execution, source, test, runs, failures, total, maximum) '
+                'select execution, source, test, sum(success), '
+                'sum(1 - success), sum(success * duration), '
+                'coalesce(max(success * duration), 0) '
+                'from testtime group by execution, source, test'
+            )
 
-    def get_priority(self, test):
+    def get_executions(self):
         con = sqlite3.connect(self.db_path)
         try:
             cursor = con.execute(
-                'select avg(duration) from testtime where source=? and test=?',
-                (self.projectname, test)
+                'select id from executions where source=? and id<? '
+                'order by id desc',
+                (self.projectname, self.execution)
             )
-            return -1 * int(cursor.fetchone()[0] or 0)
+            return [x[0] for x in cursor]
         finally:
             con.close()
 
-    def add(self, test, duration):
+    def get_history(self):
+        con = sqlite3.connect(self.db_path)
+        try:
+            cursor = con.execute(
+                'select test, avg(case when success then duration end), '
+                'min(execution), max(case when success then null '
+                'else execution end) '
+                'from testtime where source=? and execution<? group by test',
+                (self.projectname, self.execution)
+            )
+            return dict((x[0], History(*x)) for x in cursor)
+        finally:
+            con.close()
+
+    def add(self, test, duration, success=True):
+        success = int(success)
         con = sqlite3.connect(self.db_path)
         with con:
             con.execute(
                 'insert into testtime'
-                '(source, test, duration, execution) values(?, ?, ?, ?)',
-                (self.projectname, test, duration, self.execution)
+                '(source, test, duration, execution, success) '
+                'values(?, ?, ?, ?, ?)',
+                (self.projectname, test, duration, self.execution, success)
+            )
+            con.execute(
+                'insert or ignore into testsummary'
+                '(execution, source, test, runs, failures, total, maximum) '
+                'values(?, ?, ?, 0, 0, 0, 0)',
+                (self.execution, self.projectname, test)
+            )
+            con.execute(
+                'update testsummary set runs=runs+?, failures=failures+?, '
+                'total=total+?, maximum=max(maximum, ?) '
+                'where execution=? and test=?',
+                (success, 1 - success, success * duration,
+                 success * duration, self.execution, test)
+            )
+            con.execute(
+                'update checkpoint set status=?, duration=? '
+                'where execution=? and test=?',
+                ('passed' if success else 'failed', duration,
+                 self.execution, test)
+            )
+        con.close()
+
+    def add_pending(self, tests):
+        con = sqlite3.connect(self.db_path)
+        with con:
+            con.executemany(
+                'insert or ignore into checkpoint'
+                '(execution, source, test, status) values(?, ?, ?, ?)',
+                [(self.execution, self.projectname, x, 'pending')
+                 for x in tests]
+            )
+        con.close()
+
+    def get_checkpoint(self):
+        con = sqlite3.connect(self.db_path)
+        try:
+            cursor = con.execute(
+                'select test, status, duration from checkpoint '
+                'where execution=?',
+                (self.execution,)
+            )
+            return dict((x[0], (x[1], x[2])) for x in cursor)
+        finally:
+            con.close()
+
+    def finish(self):
+        con = sqlite3.connect(self.db_path)
+        with con:
+            con.execute(
+                'update executions set finished=1 where id=?',
+                (self.execution,)
             )
         con.close()
 
-    def show(self):
+    def get_sources(self):
+        con = sqlite3.connect(self.db_path)
+        try:
+            cursor = con.execute(
+                'select distinct source from testsummary order by source'
+            )
+            return [x[0] for x in cursor]
+        finally:
+            con.close()
+
+    def iter_durations(self, source):
+        con = sqlite3.connect(self.db_path)
+        try:
+            for row in con.execute(
+                    'select test, duration from testtime '
+                    'where source=? and success=1 order by test, duration',
+                    (source,)
+            ):
+                yield row
+        finally:
+            con.close()
+
+    def get_summaries(self, source):
+        con = sqlite3.connect(self.db_path)
+        try:
+            cursor = con.execute(
+                'select e.id, e.timestamp, count(s.test), sum(s.runs), '
+                'sum(s.failures), sum(s.total), max(s.maximum) '
+                'from testsummary s join executions e on s.execution=e.id '
+                'where s.source=? group by e.id order by e.id',
+                (source,)
+            )
+            return cursor.fetchall()
+        finally:
+            con.close()
+
+    def get_averages(self, execution):
+        con = sqlite3.connect(self.db_path)
+        try:
+            cursor = con.execute(
+                'select test, total / runs from testsummary '
+                'where execution=? and runs > 0',
+                (execution,)
+            )
+            return dict(cursor)
+        finally:
+            con.close()
+
+    def show(self, output_format='table', top=10, threshold=0.2):
         if not os.path.exists(self.db_path):
             print("No database was found")
             return
         con = sqlite3.connect(self.db_path)
-        for item in con.execute('select distinct source from testtime'):
-            projectname = item[0]
-            for test in con.execute(
-                    'select test, avg(duration) from testtime where source=? '
-                    'group by test order by avg(duration) desc',
-                    (projectname,)
-            ):
-                print('    %.2f: %s' % (test[1], test[0]))
-
+        self._migrate(con)
         con.close()
+        analytics = Analytics(self, top=top, threshold=threshold)
+        print(analytics.render(output_format))
@@ -0,0 +1,65 @@
+class DurationOrder(object):
+    def __init__(self, history, executions):
+        self.history = history
+        self.executions = executions
+
+    def duration(self, name):
+        history = self.history.get(name)
+        return history.duration if history and history.duration else 0
+
+    def priorities(self, names):
+        return dict((name, -1 * int(self.duration(name))) for name in names)
+
+
+class FailuresFirstOrder(DurationOrder):
+    # Only BUDGET of the estimated total time is moved to the front, so the
+    # longest tests are not delayed enough to stretch the makespan.
+    BONUS = 10 ** 8
+    BUDGET = 0.1
+
+    def __init__(self, history, executions):
+        super(FailuresFirstOrder, self).__init__(history, executions)
+        known = sorted(x.duration for x in history.values() if x.duration)
+        self.default_duration = known[len(known) // 2] if known else 0
+        self.ages = dict((x, age) for age, x in enumerate(executions))
+
+    def duration(self, name):
+        return (
+            super(FailuresFirstOrder, self).duration(name)
+            or self.default_duration
+        )
+
+    def score(self, name):
+        history = self.history.get(name)
+        if history is None:
+            return 1.0
+        return max(
+            self._decay(history.last_failure),
+            self._decay(history.first_execution, oldest=False) / 2,
+        )
+
+    def _decay(self, execution, oldest=True):
+        age = self.ages.get(execution)
+        if age is None or (not oldest and age == len(self.ages) - 1):
+            return 0.0
+        return 2.0 ** -age
+
+    def priorities(self, names):
+        priorities = super(FailuresFirstOrder, self).priorities(names)
+        candidates = sorted(
+            (x for x in names if self.score(x) > 0),
+            key=lambda x: (-self.score(x), -self.duration(x)),
+        )
+        budget = self.BUDGET * sum(self.duration(x) for x in names)
+        for position, name in enumerate(candidates):
+            budget -= self.duration(name)
+            if budget < 0 and position:
+                break
+            priorities[name] = position - self.BONUS
+        return priorities
+
+
+ORDERS = {
+    'duration': DurationOrder,
+    'failures-first': FailuresFirstOrder,
+}
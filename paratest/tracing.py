@@ -0,0 +1,98 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+class NullSpan(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class NullTracer(object):
+    enabled = False
+    _span = NullSpan()
+
+    def span(self, name, category='paratest', **args):
+        return self._span
+
+    def export(self, path):
+        pass
+
+
+class Tracer(object):
+    enabled = True
+    FILENAME = 'trace.json'
+
+    def __init__(self):
+        self._events = []
+        self._lock = threading.Lock()
+        self._origin = time.time()
+        self._pid = os.getpid()
+        self._threads = {}
+
+    @contextmanager
+    def span(self, name, category='paratest', **args):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.time(), args)
+
+    def record(self, name, category, start, end, args=None):
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': self._microseconds(start),
+            'dur': self._microseconds(end) - self._microseconds(start),
+            'pid': self._pid,
+            'tid': self._thread_id(thread),
+            'args': args or {},
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def _microseconds(self, timestamp):
+        return int((timestamp - self._origin) * 1000000)
+
+    def _thread_id(self, thread):
+        with self._lock:
+            if thread.name not in self._threads:
+                self._threads[thread.name] = len(self._threads)
+            return self._threads[thread.name]
+
+    def _metadata(self):
+        events = [{
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self._pid,
+            'args': {'name': 'paratest'},
+        }]
+        for name, tid in self._threads.items():
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': self._pid,
+                'tid': tid,
+                'args': {'name': 'main' if name == 'MainThread' else name},
+            })
+        return events
+
+    def export(self, path):
+        filename = os.path.join(path, self.FILENAME)
+        with self._lock:
+            events = self._metadata() + sorted(
+                self._events, key=lambda x: x['ts']
+            )
+        with open(filename, 'w') as fd:
+            json.dump(
+                {'traceEvents': events, 'displayTimeUnit': 'ms'},
+                fd,
+            )
+        return filename
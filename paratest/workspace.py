@@ -0,0 +1,147 @@
+import os
+import errno
+import shutil
+import logging
+import threading
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+logger = logging.getLogger('paratest')
+FICLONE = 0x40049409
+UNSUPPORTED = (
+    errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EOPNOTSUPP, errno.EPERM,
+)
+
+
+class CloneException(Exception):
+    pass
+
+
+def reflink(source, destination):
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, 'reflinks are not supported')
+    with open(source, 'rb') as src:
+        with open(destination, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, destination)
+
+
+def hardlink(source, destination):
+    os.link(source, destination)
+
+
+def copy(source, destination):
+    shutil.copy2(source, destination)
+
+
+def remove(path):
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+
+
+class Tree(object):
+    def __init__(self, path):
+        self.path = path
+        self.directories = []
+        self.files = []
+        self.symlinks = []
+        self._scan()
+
+    def _scan(self):
+        for root, dirs, files in os.walk(self.path):
+            relroot = os.path.relpath(root, self.path)
+            for name in dirs + files:
+                self._add(os.path.normpath(os.path.join(relroot, name)))
+
+    def _add(self, relpath):
+        path = os.path.join(self.path, relpath)
+        if os.path.islink(path):
+            self.symlinks.append((relpath, os.readlink(path)))
+        elif os.path.isdir(path):
+            self.directories.append(relpath)
+        else:
+            self.files.append(relpath)
+
+
+class Cloner(object):
+    METHODS = {
+        'reflink': [reflink],
+        'hardlink': [hardlink],
+        'copy': [copy],
+        'auto': [reflink, copy],
+    }
+
+    def __init__(self, method='auto'):
+        if method not in self.METHODS:
+            raise CloneException('Unknown clone method %s' % method)
+        self.method = method
+        self._strategies = list(self.METHODS[method])
+        self._lock = threading.Lock()
+
+    def clone(self, source, destination):
+        self.clone_many(source, [destination])
+
+    def clone_many(self, source, destinations):
+        tree = Tree(source)
+        errors = []
+        threads = [
+            threading.Thread(
+                target=self._clone_tree,
+                args=(tree, destination, errors),
+            )
+            for destination in destinations
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise CloneException(
+                'Could not clone %s: %s' % (source, errors[0])
+            )
+
+    def _clone_tree(self, tree, destination, errors):
+        try:
+            self._replicate(tree, destination)
+        except (OSError, IOError, CloneException) as e:
+            errors.append(e)
+
+    def _replicate(self, tree, destination):
+        logger.debug("Cloning %s into %s", tree.path, destination)
+        remove(destination)
+        for relpath in [''] + tree.directories:
+            path = os.path.join(destination, relpath)
+            if not os.path.isdir(path):
+                os.makedirs(path)
+        for relpath, target in tree.symlinks:
+            os.symlink(target, os.path.join(destination, relpath))
+        for relpath in tree.files:
+            self._clone_file(
+                os.path.join(tree.path, relpath),
+                os.path.join(destination, relpath),
+            )
+
+    def _clone_file(self, source, destination):
+        for strategy in list(self._strategies):
+            try:
+                return strategy(source, destination)
+            except (OSError, IOError) as e:
+                if e.errno not in UNSUPPORTED:
+                    raise
+                self._discard(strategy)
+        raise CloneException(
+            'Clone method %s is not supported here' % self.method
+        )
+
+    def _discard(self, strategy):
+        with self._lock:
+            if strategy in self._strategies and len(self._strategies) > 1:
+                logger.info(
+                    "%s is not supported; falling back", strategy.__name__
+                )
+                self._strategies.remove(strategy)
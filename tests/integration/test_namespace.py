@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from subprocess import Popen, PIPE
+from paratest.isolation import Namespace
+try:
+    from shutil import which
+except ImportError:
+    from distutils.spawn import find_executable as which
+
+
+@unittest.skipUnless(
+    which('unshare') and which('nsenter') and which('ip'),
+    'unshare, nsenter and ip are required',
+)
+class NamespaceTest(unittest.TestCase):
+    def setUp(self):
+        self.workspace = tempfile.mkdtemp(dir='/tmp')
+        self.outside = tempfile.mkdtemp(dir='/tmp')
+        self.sut = Namespace('0', [self.workspace]).start()
+
+    def tearDown(self):
+        self.sut.stop()
+        shutil.rmtree(self.workspace)
+        shutil.rmtree(self.outside)
+
+    def run_inside(self, command, cwd=None):
+        process = Popen(
+            self.sut.wrap(['/bin/sh', '-c', command], cwd=cwd),
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+        stdout, _ = process.communicate()
+        assert process.returncode == 0
+        return stdout.decode('utf-8')
+
+    def test_private_tmp(self):
+        self.run_inside('touch /tmp/private %s/shared' % self.workspace)
+
+        assert not os.path.exists('/tmp/private')
+        assert os.path.exists(os.path.join(self.workspace, 'shared'))
+        assert self.run_inside('ls -d %s || true' % self.outside) == ''
+
+    def test_loopback_is_up(self):
+        assert 'UP' in self.run_inside('ip -o link show lo')
+
+    def test_runs_in_the_given_directory(self):
+        assert self.run_inside('pwd', cwd=self.workspace).strip() == (
+            os.path.realpath(self.workspace)
+        )
+        assert self.run_inside('pwd').strip() == os.getcwd()
+
+    def test_no_process_survives_stop(self):
+        marker = os.path.join(self.workspace, 'pid')
+        self.run_inside(
+            'nohup sleep 60 >/dev/null 2>&1 & echo $! > %s' % marker
+        )
+        inside = self.run_inside('cat %s' % marker).strip()
+        assert self.run_inside('kill -0 %s && echo alive' % inside) == (
+            'alive\n'
+        )
+
+        self.sut.stop()
+
+        assert not any(
+            self.sleeps_forever(pid) for pid in os.listdir('/proc')
+            if pid.isdigit()
+        )
+
+    @staticmethod
+    def sleeps_forever(pid):
+        try:
+            with open('/proc/%s/cmdline' % pid, 'rb') as fd:
+                return fd.read() == b'sleep\x0060\x00'
+        except IOError:
+            return False
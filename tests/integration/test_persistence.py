@@ -1,6 +1,7 @@
 import os
 import unittest
 from paratest.persistence import Persistence
+from paratest.analytics import Analytics
 
 
 class PersistenceTest(unittest.TestCase):
@@ -14,3 +15,63 @@ class PersistenceTest(unittest.TestCase):
     def test_initialize(self):
         self.sut.initialize()
         assert os.path.exists(self.db_file)
+
+    def test_history(self):
+        self.sut.initialize()
+        self.sut.add('passing', 2)
+        self.sut.add('failing', 1, success=False)
+        previous = self.sut.execution
+        self.sut.initialize()
+
+        history = self.sut.get_history()
+
+        assert self.sut.get_executions() == [previous]
+        assert history['passing'].duration == 2
+        assert history['passing'].last_failure is None
+        assert history['failing'].duration is None
+        assert history['failing'].last_failure == previous
+
+    def test_analytics(self):
+        self.sut.initialize()
+        for duration in (1, 2, 3, 4):
+            self.sut.add('stable', duration)
+        self.sut.add('slower', 1)
+        self.sut.initialize()
+        self.sut.add('slower', 2)
+        self.sut.add('stable', 2.5)
+
+        data = Analytics(self.sut, top=1, threshold=0.5).collect()['TEST']
+
+        stable = [x for x in data['tests'] if x['test'] == 'stable'][0]
+        assert (stable['p50'], stable['p95'], stable['max']) == (2.5, 4, 4)
+        assert data['slowest'] == ['stable']
+        assert [x['tests'] for x in data['trends']] == [2, 2]
+        assert [x['longest'] for x in data['trends']] == [4, 2.5]
+        assert [x['test'] for x in data['regressions']] == ['slower']
+
+    def test_resume(self):
+        self.sut.initialize()
+        self.sut.add_pending(['passed', 'failed', 'pending'])
+        self.sut.add('passed', 1)
+        self.sut.add('failed', 1, success=False)
+        interrupted = self.sut.execution
+
+        self.sut.initialize(resume=True)
+
+        assert self.sut.resumed
+        assert self.sut.execution == interrupted
+        assert self.sut.get_checkpoint() == {
+            'passed': ('passed', 1),
+            'failed': ('failed', 1),
+            'pending': ('pending', None),
+        }
+
+    def test_resume_after_finished_execution(self):
+        self.sut.initialize()
+        self.sut.finish()
+        finished = self.sut.execution
+
+        self.sut.initialize(resume=True)
+
+        assert not self.sut.resumed
+        assert self.sut.execution != finished
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import time
+import threading
+import unittest
+from paratest import Abort, Configuration, Events, Paratest, Persistence
+
+
+def find(tests, command):
+    def find(path, test_pattern, file_pattern, output_path):
+        return [('%s%s' % (command, i), command) for i in range(tests)]
+    return find
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def create(self, name, **options):
+        config = Configuration()
+        config.workers = 2
+        for key, value in options.items():
+            setattr(config, key, value)
+        config.source = os.path.join(self.path, name, 'source')
+        config.output_path = os.path.join(self.path, name, 'output')
+        config.workspace_path = os.path.join(self.path, name, 'workspaces')
+        persistence = Persistence(os.path.join(self.path, name + '.db'), name)
+        persistence.initialize()
+        return Paratest(config, persistence)
+
+    def test_events(self):
+        sut = self.create('events')
+        finished = []
+        sut.on(Events.TEST_FINISHED, lambda worker, report: finished.append(
+            report.test.name
+        ))
+
+        sut.run(find(3, 'true'))
+
+        assert sorted(finished) == ['true0', 'true1', 'true2']
+        assert all(x.success for x in sut.reports)
+
+    def test_concurrent_sessions(self):
+        sessions = [self.create('first'), self.create('second')]
+        threads = [
+            threading.Thread(target=sessions[0].run, args=(find(5, 'true'),)),
+            threading.Thread(target=sessions[1].run, args=(find(7, ':'),)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(sessions[0].reports) == 5
+        assert len(sessions[1].reports) == 7
+        assert sessions[0].config.scripts is not sessions[1].config.scripts
+
+    def test_stops_after_the_maximum_of_failures(self):
+        sut = self.create('failfast', max_failures=1)
+        # the failing test is the longest known one, so it runs first
+        sut.persistence.add('fail', 100)
+        sut.persistence.initialize()
+        sleeps = find(4, "trap '' TERM; sleep 10 #")
+        start = time.time()
+
+        with self.assertRaises(Abort):
+            sut.run(lambda *args, **kwargs: (
+                [('fail', 'false')] + sleeps(*args, **kwargs)
+            ))
+
+        assert time.time() - start < 5
+        assert sut.fail_fast.reason == 'Reached the maximum of 1 failures'
+        assert sorted(x.name for x in sut.fail_fast.skipped) == [
+            "trap '' TERM; sleep 10 #%s" % i for i in range(4)
+        ]
+        assert [(x.test.name, x.success) for x in sut.reports] == [
+            ('fail', False),
+        ]
+
+    def test_resume_a_stopped_session(self):
+        sut = self.create('resume', max_failures=1, workers=1)
+        for name in ('pass0', 'pass1'):
+            sut.persistence.add(name, 100)
+        sut.persistence.initialize()
+        with self.assertRaises(Abort):
+            sut.run(lambda *args, **kwargs: [
+                ('pass0', 'true'), ('pass1', 'true'), ('flaky', 'false'),
+                ('later', 'true'),
+            ])
+        persistence = Persistence(sut.persistence.db_path, 'resume')
+        persistence.initialize(resume=True)
+        sut = Paratest(sut.config, persistence)
+
+        sut.run(lambda *args, **kwargs: [
+            ('pass0', 'true'), ('pass1', 'true'), ('flaky', 'true'),
+            ('later', 'true'),
+        ])
+
+        assert sorted(x.test.name for x in sut.resumed) == ['pass0', 'pass1']
+        assert sorted(x.test.name for x in sut.reports) == [
+            'flaky', 'later', 'pass0', 'pass1',
+        ]
+        assert all(x.success for x in sut.reports)
+        persistence.initialize(resume=True)
+        assert not persistence.resumed
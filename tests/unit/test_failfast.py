@@ -0,0 +1,64 @@
+import unittest
+from paratest.failfast import FailFast
+from paratest.paratest import Test as Suite
+
+
+class FailFastTest(unittest.TestCase):
+    def setUp(self):
+        self.reasons = []
+
+    def create(self, **kwargs):
+        return FailFast(on_stop=self.reasons.append, **kwargs)
+
+    def test_disabled_by_default(self):
+        sut = self.create()
+
+        for i in range(20):
+            sut.record(Suite(str(i), 'false'), False)
+
+        assert not sut.stopped
+
+    def test_max_failures(self):
+        sut = self.create(max_failures=2)
+
+        sut.record(Suite('a', 'false'), False)
+        assert not sut.stopped
+        sut.record(Suite('b', 'false'), False)
+
+        assert sut.stopped
+        assert self.reasons == ['Reached the maximum of 2 failures']
+
+    def test_smoke(self):
+        sut = self.create(smoke=['smoke.*'])
+
+        sut.record(Suite('other', 'false'), False)
+        sut.record(Suite('smoke.login', 'false'), False)
+
+        assert sut.reason == 'Smoke test smoke.login failed'
+
+    def test_failure_rate_needs_a_sample(self):
+        sut = self.create(max_failure_rate=0.5)
+
+        for i in range(FailFast.MIN_SAMPLE - 1):
+            sut.record(Suite(str(i), 'false'), False)
+        assert not sut.stopped
+        sut.record(Suite('last', 'false'), False)
+
+        assert sut.stopped
+
+    def test_stops_once(self):
+        sut = self.create()
+
+        sut.stop('first')
+        sut.stop('second')
+
+        assert self.reasons == ['first']
+
+    def test_failure_rate_sample_completed_by_a_pass(self):
+        sut = self.create(max_failure_rate=0.5)
+
+        for i in range(FailFast.MIN_SAMPLE - 1):
+            sut.record(Suite(str(i), 'false'), False)
+        sut.record(Suite('last', 'true'), True)
+
+        assert sut.stopped
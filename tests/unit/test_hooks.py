@@ -0,0 +1,63 @@
+import unittest
+from paratest.hooks import Hook, Session, command_line, split
+
+
+class SplitTest(unittest.TestCase):
+    def test_plain_command(self):
+        assert split('pytest tests -k foo') == ['pytest', 'tests', '-k', 'foo']
+
+    def test_shell_syntax(self):
+        assert split('make && make test') is None
+        assert split('A=1 make') is None
+        assert split('cd tests') is None
+
+    def test_builtins_run_in_the_shell(self):
+        for builtin in ('hash', 'times', 'jobs', 'umask'):
+            assert split(builtin) is None
+            assert Hook(builtin).run() == 0
+
+    def test_command_line(self):
+        assert command_line('true') == ['true']
+        assert command_line('true; false') == ['/bin/sh', '-c', 'true; false']
+
+
+class HookTest(unittest.TestCase):
+    def test_unset(self):
+        sut = Hook(None)
+
+        assert not sut
+        assert sut.run() is None
+
+    def test_placeholders_are_solved_once(self):
+        sut = Hook('test -n {id}', id='3')
+
+        assert sut.command == ['test', '-n', '3']
+        assert sut.run() == 0
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self):
+        self.sut = Session()
+
+    def tearDown(self):
+        self.sut.close()
+
+    def test_run(self):
+        assert self.sut.run('echo one; echo two') == (0, 'one\ntwo\n', '')
+        assert self.sut.run('false')[0] == 1
+
+    def test_stderr_is_kept_apart(self):
+        assert self.sut.run('echo out; echo err >&2') == (0, 'out\n', 'err\n')
+
+    def test_empty_and_comment_only(self):
+        assert self.sut.run('') == (0, '', '')
+        assert self.sut.run('# nothing to do') == (0, '', '')
+        assert self.sut.run('true')[0] == 0
+
+    def test_exit_restarts_the_shell(self):
+        assert self.sut.run('exit 3')[0] == 3
+        assert self.sut.run('true')[0] == 0
+
+    def test_exit_0(self):
+        assert self.sut.run('exit 0')[0] == 0
+        assert self.sut.run('false')[0] == 1
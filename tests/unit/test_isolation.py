@@ -0,0 +1,28 @@
+import shutil
+import tempfile
+import unittest
+from paratest.isolation import Namespace
+
+
+class NamespaceTest(unittest.TestCase):
+    def setUp(self):
+        self.workspace = tempfile.mkdtemp(dir='/tmp')
+
+    def tearDown(self):
+        shutil.rmtree(self.workspace)
+
+    def test_rebinds_paths_below_tmp(self):
+        sut = Namespace('0', [self.workspace, '/not/in/tmp'])
+
+        script = sut.script()
+
+        assert 'mount -t tmpfs tmpfs /tmp' in script
+        assert "mount --no-canonicalize --bind /proc/self/fd/3 '%s'" % (
+            self.workspace
+        ) in script
+        assert '/not/in/tmp' not in script
+
+    def test_wrap_without_namespace(self):
+        sut = Namespace('0')
+
+        assert sut.wrap(['true']) == ['true']
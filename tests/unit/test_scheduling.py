@@ -0,0 +1,36 @@
+import unittest
+from paratest.persistence import History
+from paratest.scheduling import DurationOrder, FailuresFirstOrder
+
+
+class SchedulingTest(unittest.TestCase):
+    executions = [3, 2, 1]
+    history = {
+        'long': History('long', 100, 1, None),
+        'short': History('short', 1, 1, None),
+        'failed': History('failed', 3, 1, 3),
+        'added': History('added', 5, 3, None),
+    }
+    names = ['long', 'short', 'failed', 'added', 'new']
+
+    def order(self, sut):
+        priorities = sut.priorities(self.names)
+        return sorted(self.names, key=lambda x: priorities[x])
+
+    def test_duration(self):
+        sut = DurationOrder(self.history, self.executions)
+
+        assert self.order(sut)[:2] == ['long', 'added']
+        assert self.order(sut)[-1] == 'new'
+
+    def test_failures_first(self):
+        sut = FailuresFirstOrder(self.history, self.executions)
+        sut.BUDGET = 0.2
+
+        assert self.order(sut) == ['new', 'failed', 'added', 'long', 'short']
+
+    def test_failures_first_keeps_a_budget(self):
+        sut = FailuresFirstOrder(self.history, self.executions)
+        sut.BUDGET = 0.05
+
+        assert self.order(sut) == ['new', 'long', 'added', 'failed', 'short']
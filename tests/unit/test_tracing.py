@@ -0,0 +1,34 @@
+import json
+import shutil
+import tempfile
+import unittest
+from paratest.tracing import Tracer, NullTracer
+
+
+class TracerTest(unittest.TestCase):
+    def setUp(self):
+        self.output = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output)
+
+    def test_export_chrome_trace(self):
+        sut = Tracer()
+        with sut.span('queue_tests', 'discovery', tests=3):
+            pass
+
+        with open(sut.export(self.output)) as fd:
+            trace = json.load(fd)
+
+        spans = [x for x in trace['traceEvents'] if x['ph'] == 'X']
+        assert len(spans) == 1
+        assert spans[0]['name'] == 'queue_tests'
+        assert spans[0]['cat'] == 'discovery'
+        assert spans[0]['args'] == {'tests': 3}
+
+    def test_null_tracer_does_not_export(self):
+        sut = NullTracer()
+        with sut.span('run'):
+            pass
+
+        assert sut.export(self.output) is None
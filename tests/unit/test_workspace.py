@@ -0,0 +1,52 @@
+import os
+import shutil
+import tempfile
+import unittest
+from paratest.workspace import Cloner, CloneException
+
+
+class ClonerTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.golden = os.path.join(self.path, 'golden')
+        os.makedirs(os.path.join(self.golden, 'sub'))
+        with open(os.path.join(self.golden, 'sub', 'file'), 'w') as fd:
+            fd.write('content')
+        os.symlink('sub/file', os.path.join(self.golden, 'link'))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def clones(self, number):
+        return [os.path.join(self.path, str(i)) for i in range(number)]
+
+    def test_copy_many(self):
+        destinations = self.clones(3)
+
+        Cloner('copy').clone_many(self.golden, destinations)
+
+        for destination in destinations:
+            with open(os.path.join(destination, 'link')) as fd:
+                assert fd.read() == 'content'
+
+    def test_hardlink(self):
+        destination, = self.clones(1)
+
+        Cloner('hardlink').clone(self.golden, destination)
+
+        assert os.stat(os.path.join(destination, 'sub', 'file')).st_nlink == 2
+
+    def test_unknown_method(self):
+        with self.assertRaises(CloneException):
+            Cloner('magic')
+
+    def test_clone_twice_into_the_same_destination(self):
+        destination, = self.clones(1)
+        Cloner('hardlink').clone(self.golden, destination)
+        with open(os.path.join(destination, 'stale'), 'w') as fd:
+            fd.write('stale')
+
+        Cloner('copy').clone(self.golden, destination)
+        Cloner('hardlink').clone(self.golden, destination)
+
+        assert sorted(os.listdir(destination)) == ['link', 'sub']